@@ -11,18 +11,40 @@
 <<<
 """
 
-from os import listdir, walk, sep, remove, rename, makedirs
-from os.path import join, exists, isdir, splitext, dirname, basename, normpath, abspath
+from os import scandir, walk, sep, remove, replace, makedirs, stat, cpu_count, name as os_name
+from os.path import join, exists, splitext, dirname, basename, abspath, relpath, getsize
 from shutil import copyfile
-from hashlib import md5
+import filecmp
+from xxhash import xxh3_128
+import mmap
 import re
+from functools import lru_cache
+from collections import Counter
 from zipfile import ZipFile
 from gzip import GzipFile
 import json
 from tempfile import gettempdir as tempdir
-from subprocess import run
+from subprocess import run, PIPE, STDOUT
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import atexit
+from time import time_ns
 
 PARAMS_FILE = '.ttparams'
+HASH_CACHE_FILE = '.tthashes.json'
+HASH_NAME = 'xxh3_128'
+
+# files modified within this many nanoseconds are not cached
+MTIME_GRANULARITY = 2 * 10**9
+
+# files of at least this size are hashed via mmap
+MMAP_THRESHOLD = 1 << 20
+
+VERSION_PATTERN = re.compile(r'^v\d(\.\d+)*$')
+
+# keeping file descriptors open lets POSIX systems use posix_spawn for xdelta,
+# on Windows they are closed so concurrent processes do not inherit each other's pipes
+CLOSE_FDS = os_name == 'nt'
 
 # 0: nothing, 1: minimal, 2: default, 3: all
 VERBOSE = 2
@@ -77,31 +99,120 @@ class Params:
 ## Helper ##
 ############
 
+class HashCache:
+	""" Caches file hashes by path, modification time and size.
+		The cache is loaded from the HASH_CACHE_FILE on first use and
+		saved back on exit. Files modified too recently are not cached,
+		as their modification time cannot be trusted yet.
+	"""
+	entries = None # relative path -> (mtime_ns, size, digest)
+	cache_file = None
+	modified = False
+	lock = Lock()
+	
+	def load():
+		with HashCache.lock: HashCache._load()
+	
+	def _load():
+		if HashCache.entries is not None: return
+		HashCache.entries = dict()
+		HashCache.cache_file = abspath(HASH_CACHE_FILE)
+		try:
+			with open(HashCache.cache_file, 'r') as file: data = json.load(file)
+			if data['hash'] == HASH_NAME: # ignore hashes from other hash functions
+				for path, (mtime, size, digest) in data['files'].items():
+					HashCache.entries[path] = (mtime, size, bytes.fromhex(digest))
+		except: pass
+		atexit.register(HashCache.save)
+	
+	def save():
+		if not HashCache.modified: return
+		files = {path: [mtime, size, digest.hex()] for path, (mtime, size, digest) in HashCache.entries.items() if exists(join(dirname(HashCache.cache_file), path))}
+		data = {'hash': HASH_NAME, 'files': files}
+		try:
+			with open(HashCache.cache_file, 'w') as file: json.dump(data, file)
+		except OSError: pass
+		HashCache.modified = False
+	
+	def get(file):
+		HashCache.load()
+		path = relpath(file, dirname(HashCache.cache_file))
+		st = stat(file)
+		entry = HashCache.entries.get(path)
+		if entry and entry[:2] == (st.st_mtime_ns, st.st_size): return entry[2]
+		start = time_ns()
+		digest = hash(file)
+		if st.st_mtime_ns < start - MTIME_GRANULARITY:
+			HashCache.entries[path] = (st.st_mtime_ns, st.st_size, digest)
+			HashCache.modified = True
+		return digest
+
 def hash(file):
-	""" Calculates the MD5 hash of the given file. """
-	hasher = md5()
-	with open(file, 'rb') as f: hasher.update(f.read())
+	""" Calculates the XXH3 hash of the given file.
+		Small files are read at once, large files are memory-mapped.
+	"""
+	hasher = xxh3_128()
+	with open(file, 'rb') as f:
+		if getsize(file) < MMAP_THRESHOLD:
+			hasher.update(f.read())
+		else:
+			try:
+				with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm: hasher.update(mm)
+			except (OSError, ValueError):
+				# mmap not available (e.g. network drive) -> read in chunks
+				hasher = xxh3_128()
+				f.seek(0)
+				for chunk in iter(lambda: f.read(MMAP_THRESHOLD), b''): hasher.update(chunk)
 	return hasher.digest()
 
+def filesEqual(file1, file2, use_hash = False):
+	""" Checks whether the given files have the same content.
+		Files with different sizes are never read. The contents are
+		compared byte by byte, or by their cached hashes if use_hash
+		is set.
+	"""
+	if getsize(file1) != getsize(file2): return False
+	if use_hash: return HashCache.get(file1) == HashCache.get(file2)
+	return filecmp.cmp(file1, file2, shallow=False)
+
+def runParallel(job, args):
+	""" Runs the job for all given argument tuples in a thread pool
+		and yields the results in order.
+	"""
+	with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
+		yield from executor.map(lambda a: job(*a), args)
+
 def hashZip(zipfile):
-	hasher = md5()
+	""" Calculates a hash of the contents of the given zip file.
+		Only the names, sizes and CRC32 checksums from the central
+		directory are used, so no member is decompressed.
+	"""
+	hasher = xxh3_128()
 	with ZipFile(zipfile, 'r') as zip:
-		for filename in sorted([info.filename for info in zip.infolist()]):
-			hasher.update(filename.encode())
-			hasher.update(zip.read(filename))
+		for info in sorted(zip.infolist(), key=lambda info: info.filename):
+			hasher.update(info.filename.encode())
+			hasher.update(info.file_size.to_bytes(8, 'little'))
+			hasher.update(info.CRC.to_bytes(4, 'little'))
 	return hasher.digest()
 
 def extpath(path):
-	return normpath(path).split(sep)[1:]
+	""" Splits the given path into its parts without the top folder.
+		The path has to be normalized already, e.g. a path from walk.
+	"""
+	return path.split(sep)[1:]
 
 def splitFolder(folder):
+	return dict(_splitFolder(folder))
+
+@lru_cache(maxsize=None)
+def _splitFolder(folder):
 		a = folder.split('_')
 		parts = {'folder': a[0]}
 		if len(a) > 1:
-			if re.match('^v\d(\.\d+)*$', a[1]): parts['version'] = a[1]
+			if VERSION_PATTERN.match(a[1]): parts['version'] = a[1]
 			else: parts['lang'] = a[1]
 		if len(a) > 2: parts['lang'] = a[2]
-		return parts
+		return tuple(parts.items())
 
 def joinFolder(folder, language, version = None):
 	name = folder
@@ -112,19 +223,26 @@ def joinFolder(folder, language, version = None):
 def loopFiles(folders, original_language = None):
 	""" Loops over the files in the folders with the given names that
 		match the given file types.
-		It returns tuples of the folder and edit filename.
+		It returns tuples of the folder and the edit filenames for every
+		edit folder.
 		If original_language is given, it addionally returns the
 		corresponding original folder.
 	"""
+	# group all directories by folder
+	dirnames = dict() # folder -> list of directory names
+	for entry in scandir('.'):
+		if entry.is_dir(): dirnames.setdefault(splitFolder(entry.name)['folder'], list()).append(entry.name)
+	
 	if original_language:
-		directories = [splitFolder(dir) for dir in listdir('.') if isdir(dir)]
 		# iterate over all defined folders
 		for folder, types in folders.items():
-			versions = {dir.get('version') for dir in directories if dir['folder'] == folder and dir.get('lang') == original_language}
+			types = frozenset(types)
+			directories = [splitFolder(dir) for dir in dirnames.get(folder, list())]
+			versions = {dir.get('version') for dir in directories if dir.get('lang') == original_language}
 			if not versions: continue
 			
 			# iterate over all languages found
-			for version, language in [(dir.get('version'), dir.get('lang')) for dir in directories if dir['folder'] == folder and dir.get('version') in versions and dir.get('lang') != original_language]:
+			for version, language in [(dir.get('version'), dir.get('lang')) for dir in directories if dir.get('version') in versions and dir.get('lang') != original_language]:
 				edit_folder = joinFolder(folder, language, version)
 				orig_folder = joinFolder(folder, original_language, version)
 				if VERBOSE >= 1: print(edit_folder, end=' ', flush=True)
@@ -132,20 +250,19 @@ def loopFiles(folders, original_language = None):
 				# iterate over all files with a valid file extension
 				files = [join(dp, f) for dp, dn, fn in walk(edit_folder) for f in [n for n in fn if splitext(n)[1] in types]]
 				if VERBOSE >= 1: print('[%s]' % len(files))
-				for edit_file in files:
-					yield (folder, edit_file, orig_folder)
+				yield (folder, files, orig_folder)
 	
 	else:
 		for folder, types in folders.items():
+			types = frozenset(types)
 			# iterate over all languages found
-			for edit_folder in [dir for dir in listdir('.') if isdir(dir) and splitFolder(dir)['folder'] == folder]:
+			for edit_folder in dirnames.get(folder, list()):
 				if VERBOSE >= 1: print(edit_folder, end=' ', flush=True)
 				
 				# iterate over all files with a valid file extension
 				files = [join(dp, f) for dp, dn, fn in walk(edit_folder) for f in [n for n in fn if splitext(n)[1] in types]]
 				if VERBOSE >= 1: print('[%s]' % len(files))
-				for edit_file in files:
-					yield (folder, edit_file)
+				yield (folder, files)
 
 
 ###########
@@ -155,54 +272,62 @@ def loopFiles(folders, original_language = None):
 def applyPatches(xdelta, original_language = 'JA', force_override = False):
 	ctr = applyXDeltaPatches(xdelta, original_language, force_override)
 	print()
-	if VERBOSE >= 1 and ctr.get('create', 0) > 0 or VERBOSE >= 3: print('Created %d files.' % ctr.get('create', 0))
-	if VERBOSE >= 1: print('Updated %d files.' % ctr.get('update', 0))
-	if VERBOSE >= 3: print('Kept %d files.' % ctr.get('keep',   0))
+	if VERBOSE >= 1 and ctr['create'] > 0 or VERBOSE >= 3: print('Created %d files.' % ctr['create'])
+	if VERBOSE >= 1: print('Updated %d files.' % ctr['update'])
+	if VERBOSE >= 3: print('Kept %d files.' % ctr['keep'])
 
 def applyXDeltaPatches(xdelta, original_language, force_override):
 	""" Creates .* files from .*.xdelta patches and the original .* files. """
 	
+	xdelta = abspath(xdelta)
 	def applyXDelta(orig_file, patch_file, output_file):
-		run([abspath(xdelta), '-f', '-d', '-s', orig_file, patch_file, output_file])
+		return run([xdelta, '-f', '-d', '-s', orig_file, patch_file, output_file], stdout=PIPE, stderr=STDOUT, close_fds=CLOSE_FDS).stdout
 	
-	ctr = dict()
-	folders = dict(zip(Params.xdeltaFolders().keys(), ['.xdelta']*len(Params.xdeltaFolders())))
-	for _, patch_file, orig_folder in loopFiles(folders, original_language):
+	def applyXDeltaPatch(patch_file, orig_folder):
+		# returns the action, the verbosity level, the message and the xdelta output
 		simplename = extpath(patch_file)
-		simplename[-1] = simplename[-1][:-len('.xdelta')]
+		simplename[-1] = simplename[-1].removesuffix('.xdelta')
 		msg_prefix = ' * %s:' % join(*simplename)
 		
 		# find corresponding original file
 		orig_file = join(orig_folder, *simplename)
 		if not exists(orig_file):
-			print(' !', 'Warning: Original file not found:', join(*simplename))
-			continue
+			return None, 0, (' !', 'Warning: Original file not found:', join(*simplename)), bytes()
 		
 		# define output file
-		output_file = patch_file[:-len('.xdelta')]
+		output_file = patch_file.removesuffix('.xdelta')
 		
 		# check if output file already exists
 		if exists(output_file):
+			if force_override:
+				# forced -> override output file without comparing
+				output = applyXDelta(orig_file, patch_file, output_file)
+				return 'update', 2, (msg_prefix, 'update'), output
 			# create temporary output file
 			temp_output_file = output_file + '.temp'
-			applyXDelta(orig_file, patch_file, temp_output_file)
+			output = applyXDelta(orig_file, patch_file, temp_output_file)
 			# compare output files
-			if not force_override and hash(output_file) == hash(temp_output_file):
+			if filesEqual(output_file, temp_output_file):
 				# equal -> keep old output file
-				if VERBOSE >= 3: print(msg_prefix, 'keep')
-				ctr['keep'] = ctr.get('keep', 0) + 1
 				remove(temp_output_file)
+				return 'keep', 3, (msg_prefix, 'keep'), output
 			else:
 				# new -> update output file
-				if VERBOSE >= 2: print(msg_prefix, 'update')
-				ctr['update'] = ctr.get('update', 0) + 1
-				remove(output_file)
-				rename(temp_output_file, output_file)
+				replace(temp_output_file, output_file)
+				return 'update', 2, (msg_prefix, 'update'), output
 		else:
 			# create new output file
-			if VERBOSE >= 2: print(msg_prefix, 'create')
-			ctr['create'] = ctr.get('create', 0) + 1
-			applyXDelta(orig_file, patch_file, output_file)
+			output = applyXDelta(orig_file, patch_file, output_file)
+			return 'create', 2, (msg_prefix, 'create'), output
+	
+	ctr = Counter()
+	folders = {folder: ['.xdelta'] for folder in Params.xdeltaFolders()}
+	for _, patch_files, orig_folder in loopFiles(folders, original_language):
+		# process the files of one folder at a time
+		for action, verbose, msg, output in runParallel(applyXDeltaPatch, [(patch_file, orig_folder) for patch_file in patch_files]):
+			if VERBOSE >= verbose: print(*msg)
+			if output: print(output.decode(errors='replace'), end='')
+			if action: ctr[action] += 1
 	return ctr
 
 
@@ -213,66 +338,71 @@ def applyXDeltaPatches(xdelta, original_language, force_override):
 def createPatches(xdelta, original_language = 'JA', force_override = False):
 	ctr = createXDeltaPatches(xdelta, original_language, force_override)
 	print()
-	if VERBOSE >= 1 and ctr.get('create', 0) > 0 or VERBOSE >= 3: print('Created %d patches.' % ctr.get('create', 0))
-	if VERBOSE >= 1: print('Updated %d patches.' % ctr.get('update', 0))
-	if VERBOSE >= 1 and ctr.get('delete', 0) > 0 or VERBOSE >= 3: print('Deleted %d patches.' % ctr.get('delete', 0))
-	if VERBOSE >= 3: print('Kept %d patches.' % ctr.get('keep',   0))
-	if VERBOSE >= 3: print('Skipped %d files.' % ctr.get('skip',   0))
+	if VERBOSE >= 1 and ctr['create'] > 0 or VERBOSE >= 3: print('Created %d patches.' % ctr['create'])
+	if VERBOSE >= 1: print('Updated %d patches.' % ctr['update'])
+	if VERBOSE >= 1 and ctr['delete'] > 0 or VERBOSE >= 3: print('Deleted %d patches.' % ctr['delete'])
+	if VERBOSE >= 3: print('Kept %d patches.' % ctr['keep'])
+	if VERBOSE >= 3: print('Skipped %d files.' % ctr['skip'])
 
 def createXDeltaPatches(xdelta, original_language, force_override):
 	""" Creates .*.xdelta patches from pairs of .* files. """
 	
+	xdelta = abspath(xdelta)
 	def createXDelta(orig_file, edit_file, patch_file):
-		run([abspath(xdelta), '-f', '-s', orig_file, edit_file, patch_file])
+		return run([xdelta, '-f', '-s', orig_file, edit_file, patch_file], stdout=PIPE, stderr=STDOUT, close_fds=CLOSE_FDS).stdout
 	
-	ctr = dict()
-	for _, edit_file, orig_folder in loopFiles(Params.xdeltaFolders(), original_language):
+	def createXDeltaPatch(edit_file, orig_folder):
+		# returns the action, the verbosity level, the message and the xdelta output
 		simplename = extpath(edit_file)
 		msg_prefix = ' * %s:' % join(*simplename[:-1], simplename[-1]+'.xdelta')
 		
 		# find corresponding original file
 		orig_file = join(orig_folder, *simplename)
 		if not exists(orig_file):
-			if VERBOSE >= 2: print(' !', 'Warning: Original file not found:', join(*simplename))
-			continue
+			return None, 2, (' !', 'Warning: Original file not found:', join(*simplename)), bytes()
 		
 		# define patch file
 		patch_file = edit_file + '.xdelta'
 		
 		# compare files
-		if hash(orig_file) == hash(edit_file):
+		if filesEqual(orig_file, edit_file):
 			# check if patch exists
 			if exists(patch_file):
-				if VERBOSE >= 2: print(msg_prefix, 'delete patch')
-				ctr['delete'] = ctr.get('delete', 0) + 1
 				remove(patch_file)
+				return 'delete', 2, (msg_prefix, 'delete patch'), bytes()
 			else:
-				if VERBOSE >= 3: print(msg_prefix, 'skip')
-				ctr['skip'] = ctr.get('skip', 0) + 1
-			continue
+				return 'skip', 3, (msg_prefix, 'skip'), bytes()
 		
 		# check if patch already exists
 		if exists(patch_file):
+			if force_override:
+				# forced -> override patch without comparing
+				output = createXDelta(orig_file, edit_file, patch_file)
+				return 'update', 2, (msg_prefix, 'update'), output
 			# create temporary patch
 			temp_patch_file = patch_file + '.temp'
-			createXDelta(orig_file, edit_file, temp_patch_file)
+			output = createXDelta(orig_file, edit_file, temp_patch_file)
 			# compare patches
-			if not force_override and hash(patch_file) == hash(temp_patch_file):
+			if filesEqual(patch_file, temp_patch_file):
 				# equal -> keep old patch
-				if VERBOSE >= 3: print(msg_prefix, 'keep')
-				ctr['keep'] = ctr.get('keep', 0) + 1
 				remove(temp_patch_file)
+				return 'keep', 3, (msg_prefix, 'keep'), output
 			else:
 				# new -> update patch
-				if VERBOSE >= 2: print(msg_prefix, 'update')
-				ctr['update'] = ctr.get('update', 0) + 1
-				remove(patch_file)
-				rename(temp_patch_file, patch_file)
+				replace(temp_patch_file, patch_file)
+				return 'update', 2, (msg_prefix, 'update'), output
 		else:
 			# create new patch
-			if VERBOSE >= 2: print(msg_prefix, 'create')
-			ctr['create'] = ctr.get('create', 0) + 1
-			createXDelta(orig_file, edit_file, patch_file)
+			output = createXDelta(orig_file, edit_file, patch_file)
+			return 'create', 2, (msg_prefix, 'create'), output
+	
+	ctr = Counter()
+	for _, edit_files, orig_folder in loopFiles(Params.xdeltaFolders(), original_language):
+		# process the files of one folder at a time
+		for action, verbose, msg, output in runParallel(createXDeltaPatch, [(edit_file, orig_folder) for edit_file in edit_files]):
+			if VERBOSE >= verbose: print(*msg)
+			if output: print(output.decode(errors='replace'), end='')
+			if action: ctr[action] += 1
 	return ctr
 
 
@@ -293,61 +423,74 @@ def distribute(languages, version = None, version_only = False, original_languag
 	elif version is not None and version_only: versions = [version]
 	ctr = distributeOtherFiles(languages, versions, original_language, destination_dir, force_override, verbose)
 	print()
-	if VERBOSE >= 1 and ctr.get('add', 0) > 0 or VERBOSE >= 3: print('Added %d files.' % ctr.get('add', 0))
-	if VERBOSE >= 1: print('Updated %d files.' % ctr.get('update', 0))
-	if VERBOSE >= 3: print('Kept %d files.' % ctr.get('keep',   0))
+	if VERBOSE >= 1 and ctr['add'] > 0 or VERBOSE >= 3: print('Added %d files.' % ctr['add'])
+	if VERBOSE >= 1: print('Updated %d files.' % ctr['update'])
+	if VERBOSE >= 3: print('Kept %d files.' % ctr['keep'])
 
 def distributeOtherFiles(languages, versions, original_language, destination_dir, force_override, VERBOSE):
 	""" Copies all *.* files to the given destination. """
 	
+	walked = dict() # directory -> list of (dirpath, filename)
+	def walkFiles(directory, types):
+		# walk every directory only once
+		if directory not in walked: walked[directory] = [(dp, f) for dp, dn, fn in walk(directory) for f in fn]
+		return [join(dp, f) for dp, f in walked[directory] if splitext(f)[1] in types]
+	
 	def collectFiles(folder, types, ver = None):
 		# collect all files ordered by priority language
 		files = list() # list of (filename, simplename)
+		simplenames = set()
 		for lang in languages + (None,): # fallback from folders without language
-			for file in [join(dp, f) for dp, dn, fn in walk(joinFolder(folder, lang, ver)) for f in [n for n in fn if splitext(n)[1] in types]]:
+			for file in walkFiles(joinFolder(folder, lang, ver), types):
 				simplename = extpath(file)
-				if any(s == simplename for _, s in files): continue
+				if tuple(simplename) in simplenames: continue
+				simplenames.add(tuple(simplename))
 				files.append((file, simplename))
 		
 		# remove files that are the same as the original files
 		orig_folder = joinFolder(folder, original_language)
-		files = [(f, s) for f, s in files if not exists(join(orig_folder, *s)) or hash(join(orig_folder, *s)) != hash(f)]
+		def isEdited(file, simplename):
+			orig_file = join(orig_folder, *simplename)
+			return not exists(orig_file) or not filesEqual(orig_file, file, use_hash=True)
+		files = [(f, s) for (f, s), edited in zip(files, runParallel(isEdited, files)) if edited]
 		return files
 	
+	def copyFile(source_file, dest_file):
+		msg_prefix = ' * %s:' % source_file
+		
+		# check if file already exists
+		if exists(dest_file):
+			# compare files
+			if not force_override and filesEqual(dest_file, source_file):
+				# equal -> keep old file
+				return 'keep', 3, (msg_prefix, 'keep')
+			else:
+				# new -> update file
+				remove(dest_file)
+				copyfile(source_file, dest_file)
+				return 'update', 2, (msg_prefix, 'update')
+		else:
+			# add new file
+			makedirs(dirname(dest_file), exist_ok=True)
+			copyfile(source_file, dest_file)
+			return 'add', 2, (msg_prefix, 'add')
+	
 	# iterate over all xdelta folders
-	ctr = dict()
+	ctr = Counter()
+	parent_folders = Params.parentFolders()
 	for folder, types in Params.xdeltaFolders().items():
+		types = frozenset(types)
+		dest_folder = join(destination_dir, parent_folders[folder])
 		for ver in versions: # iterate over versions
 			# collect files
 			files = collectFiles(folder, types, ver)
 			if len(versions) > 1 and ver is None: # remove files that are in the original update
-				update_files = [extpath(join(dp, f)) for dp, dn, fn in walk(joinFolder(folder, original_language, versions[1])) for f in [n for n in fn if splitext(n)[1] in types]]
-				files = [(file, simplename) for file, simplename in files if simplename not in update_files]
+				update_files = {tuple(extpath(file)) for file in walkFiles(joinFolder(folder, original_language, versions[1]), types)}
+				files = [(file, simplename) for file, simplename in files if tuple(simplename) not in update_files]
 			if VERBOSE >= 3 or VERBOSE >= 1 and len(files) > 0: print(joinFolder(folder, ver), '[%d]' % len(files))
 			
 			# copy collected files
-			dest_folder = join(destination_dir, Params.parentFolders()[folder])
-			for source_file, simplename in files:
-				msg_prefix = ' * %s:' % source_file
-				dest_file = join(dest_folder, *simplename)
-				
-				# check if file already exists
-				if exists(dest_file):
-					# compare files
-					if not force_override and hash(dest_file) == hash(source_file):
-						# equal -> keep old file
-						if VERBOSE >= 3: print(msg_prefix, 'keep')
-						ctr['keep'] = ctr.get('keep', 0) + 1
-					else:
-						# new -> update file
-						if VERBOSE >= 2: print(msg_prefix, 'update')
-						ctr['update'] = ctr.get('update', 0) + 1
-						remove(dest_file)
-						copyfile(source_file, dest_file)
-				else:
-					# add new file
-					if VERBOSE >= 2: print(msg_prefix, 'add')
-					ctr['add'] = ctr.get('add', 0) + 1
-					makedirs(dirname(dest_file), exist_ok=True)
-					copyfile(source_file, dest_file)
+			for action, verbose, msg in runParallel(copyFile, [(source_file, join(dest_folder, *simplename)) for source_file, simplename in files]):
+				if VERBOSE >= verbose: print(*msg)
+				ctr[action] += 1
 	return ctr